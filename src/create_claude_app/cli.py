@@ -1,46 +1,62 @@
 """Command-line interface for create-claude-app."""
 import click
-from pathlib import Path
-from rich.console import Console
-from rich.traceback import install
-from typing import Optional
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Dict, Optional, Sequence
 
 from . import __version__
-from .prompts import (
-    ProjectConfiguration,
-    get_frontend_choice,
-    get_ui_framework_choice,
-    get_backend_choice,
-    get_database_choice,
-    get_package_manager_choice,
-    get_atlas_choice,
-    get_build_tool_choice,
-    get_github_actions_choice,
-    get_mcp_choice,
-)
-from .validators import validate_project_name, validate_directory_not_exists, validate_compatibility
-from .generators import generate_project
 
-# Install rich traceback handler
-install(show_locals=True)
+if TYPE_CHECKING:
+    from rich.console import Console
+    from .prompts import ProjectConfiguration
+
+# Rich, the prompts and the template generators are imported lazily so that
+# `--help`, `--version` and argument errors don't pay for loading them.
+
+
+@lru_cache(maxsize=1)
+def _get_console() -> "Console":
+    """Return the shared Rich console, creating it on first use.
+    
+    Returns:
+        Shared Console instance
+    """
+    from rich.console import Console
+    
+    return Console()
 
-console = Console()
 
 # Valid options for CLI arguments
-VALID_FRONTEND_OPTIONS = ['react', 'vue', 'angular', 'none']
-VALID_BACKEND_OPTIONS = ['python', 'nodejs', 'golang', 'none']
-VALID_DATABASE_OPTIONS = ['mysql', 'postgresql', 'sqlite', 'none']
-VALID_UI_OPTIONS = ['tailwind', 'shadcn', 'none']
-VALID_BUILD_TOOL_OPTIONS = ['vite', 'webpack', 'babel']
-VALID_PACKAGE_MANAGER_OPTIONS = ['npm', 'yarn']
+VALID_FRONTEND_OPTIONS = ('react', 'vue', 'angular', 'none')
+VALID_BACKEND_OPTIONS = ('python', 'nodejs', 'golang', 'none')
+VALID_DATABASE_OPTIONS = ('mysql', 'postgresql', 'sqlite', 'none')
+VALID_UI_OPTIONS = ('tailwind', 'shadcn', 'none')
+VALID_BUILD_TOOL_OPTIONS = ('vite', 'webpack', 'babel')
+VALID_PACKAGE_MANAGER_OPTIONS = ('npm', 'yarn')
+
+# Summary printed after a project is generated
+_SUMMARY_TEMPLATE = (
+    "\n[bold green]✅ Project '{project_name}' created successfully![/bold green]\n"
+    "\n[bold]📋 Summary:[/bold]\n"
+    "• Project path: {project_path}\n"
+    "• Directories created: {directories_created}\n"
+    "• Files generated: {files_created}\n"
+    "\n[bold]🎯 Next steps:[/bold]\n"
+    "1. [cyan]cd {project_name}[/cyan]\n"
+    "2. [cyan]cp .env.example .env[/cyan]\n"
+    "3. Edit .env file with your API keys\n"
+    "4. Read CLAUDE.md for detailed setup instructions"
+)
+_FRONTEND_STEP_TEMPLATE = "\n5. [cyan]cd frontend && {package_manager} install[/cyan]"
+_BACKEND_STEP = "\n6. [cyan]cd backend && pip install -r requirements.txt[/cyan]"
 
 
-def validate_cli_option(option: str, valid_options: list, option_name: str) -> str:
+def validate_cli_option(option: str, valid_options: Sequence[str], option_name: str) -> str:
     """Validate CLI option value.
     
     Args:
         option: The option value to validate
-        valid_options: List of valid option values
+        valid_options: Valid option values, in display order
         option_name: Name of the option for error messages
         
     Returns:
@@ -58,78 +74,60 @@ def validate_cli_option(option: str, valid_options: list, option_name: str) -> s
     return option if option != 'none' else None
 
 
-def create_project_with_config(project_name: str, config: ProjectConfiguration) -> None:
-    """Create a new project with pre-configured settings.
+def _start_project(project_name: str) -> str:
+    """Print the welcome banner and validate the project name and location.
     
     Args:
         project_name: Name of the project to create
-        config: Pre-configured project settings
+        
+    Returns:
+        Path of the project directory to create
         
     Raises:
         ValueError: If project name is invalid
         FileExistsError: If directory already exists
     """
+    from .validators import validate_project_name, validate_directory_not_exists
+    
+    console = _get_console()
     console.print(f"[bold cyan]🚀 Welcome to create-claude-app![/bold cyan]")
-    console.print(f"Creating a new project: [bold]{project_name}[/bold]\\n")
+    console.print(f"Creating a new project: [bold]{project_name}[/bold]\n")
     
     # Validate project name
     validate_project_name(project_name)
     
-    # Check if directory already exists
-    project_path = Path.cwd() / project_name
-    validate_directory_not_exists(str(project_path))
-    
-    # Validate compatibility
-    validate_compatibility(config.frontend, config.ui_framework)
-    
-    # Generate the project
-    console.print(f"\\n[bold yellow]📁 Generating project structure...[/bold yellow]")
-    
-    result = generate_project(str(project_path), config)
+    # Check if directory already exists. This is the only place the working
+    # directory is resolved; callers receive the absolute project path.
+    project_path = os.path.join(os.getcwd(), project_name)
+    validate_directory_not_exists(project_path)
     
-    if result['success']:
-        console.print(f"\\n[bold green]✅ Project '{project_name}' created successfully![/bold green]")
-        console.print(f"\\n[bold]📋 Summary:[/bold]")
-        console.print(f"• Project path: {result['project_path']}")
-        console.print(f"• Directories created: {len(result['directories_created'])}")
-        console.print(f"• Files generated: {len(result['files_created'])}")
-        
-        console.print(f"\\n[bold]🎯 Next steps:[/bold]")
-        console.print(f"1. [cyan]cd {project_name}[/cyan]")
-        console.print(f"2. [cyan]cp .env.example .env[/cyan]")
-        console.print(f"3. Edit .env file with your API keys")
-        console.print(f"4. Read CLAUDE.md for detailed setup instructions")
-        
-        if config.frontend and config.package_manager:
-            console.print(f"5. [cyan]cd frontend && {config.package_manager} install[/cyan]")
-        if config.backend == "python":
-            console.print(f"6. [cyan]cd backend && pip install -r requirements.txt[/cyan]")
-    else:
-        raise Exception("Project generation failed")
+    return project_path
 
 
-def create_project(project_name: str) -> None:
-    """Create a new project with the given name.
+def _build_config_interactively(project_name: str) -> "ProjectConfiguration":
+    """Gather the project configuration through interactive prompts.
     
     Args:
         project_name: Name of the project to create
         
-    Raises:
-        ValueError: If project name is invalid
-        FileExistsError: If directory already exists
+    Returns:
+        Validated project configuration
     """
-    console.print(f"[bold cyan]🚀 Welcome to create-claude-app![/bold cyan]")
-    console.print(f"Creating a new project: [bold]{project_name}[/bold]\n")
-    
-    # Validate project name
-    validate_project_name(project_name)
-    
-    # Check if directory already exists
-    project_path = Path.cwd() / project_name
-    validate_directory_not_exists(str(project_path))
+    from .prompts import (
+        ProjectConfiguration,
+        get_frontend_choice,
+        get_ui_framework_choice,
+        get_backend_choice,
+        get_database_choice,
+        get_package_manager_choice,
+        get_atlas_choice,
+        get_build_tool_choice,
+        get_github_actions_choice,
+        get_mcp_choice,
+    )
+    from .validators import validate_compatibility
     
-    # Get user choices through interactive prompts
-    console.print("[bold]Let's configure your project:[/bold]")
+    _get_console().print("[bold]Let's configure your project:[/bold]")
     
     frontend = get_frontend_choice()
     ui_framework = get_ui_framework_choice(frontend)
@@ -144,8 +142,7 @@ def create_project(project_name: str) -> None:
     # Validate compatibility
     validate_compatibility(frontend, ui_framework)
     
-    # Create project configuration
-    config = ProjectConfiguration(
+    return ProjectConfiguration(
         project_name=project_name,
         frontend=frontend,
         ui_framework=ui_framework,
@@ -157,31 +154,94 @@ def create_project(project_name: str) -> None:
         use_github_actions=use_github_actions,
         use_mcp=use_mcp
     )
+
+
+def _generate_and_report(project_path: str, config: "ProjectConfiguration") -> None:
+    """Generate the project and print the summary.
+    
+    Args:
+        project_path: Path of the project directory to create
+        config: Project configuration
+        
+    Raises:
+        Exception: If project generation fails
+    """
+    from .generators import generate_project
+    
+    _get_console().print(f"\n[bold yellow]📁 Generating project structure...[/bold yellow]")
+    
+    # _start_project has already confirmed the path is free
+    result = generate_project(project_path, config, known_missing=True)
+    
+    if not result['success']:
+        raise Exception("Project generation failed")
+    
+    _print_summary(result, config)
+
+
+def _print_summary(result: Dict[str, Any], config: "ProjectConfiguration") -> None:
+    """Print the generation summary and next steps.
     
-    # Generate the project
-    console.print(f"\n[bold yellow]📁 Generating project structure...[/bold yellow]")
+    Args:
+        result: Result dictionary returned by generate_project
+        config: Project configuration
+    """
+    parts = [_SUMMARY_TEMPLATE.format(
+        project_name=config.project_name,
+        project_path=result['project_path'],
+        directories_created=len(result['directories_created']),
+        files_created=len(result['files_created']),
+    )]
+    
+    if config.frontend and config.package_manager:
+        parts.append(_FRONTEND_STEP_TEMPLATE.format(package_manager=config.package_manager))
+    if config.backend == "python":
+        parts.append(_BACKEND_STEP)
+    
+    # Rendered in a single call so Rich parses the markup once
+    _get_console().print("".join(parts))
+
+
+def create_project_with_config(
+    project_name: str,
+    config: "ProjectConfiguration",
+    compatibility_checked: bool = False
+) -> None:
+    """Create a new project with pre-configured settings.
     
-    result = generate_project(str(project_path), config)
+    Args:
+        project_name: Name of the project to create
+        config: Pre-configured project settings
+        compatibility_checked: Whether the caller already ran validate_compatibility
+        
+    Raises:
+        ValueError: If project name is invalid
+        FileExistsError: If directory already exists
+    """
+    project_path = _start_project(project_name)
     
-    if result['success']:
-        console.print(f"\n[bold green]✅ Project '{project_name}' created successfully![/bold green]")
-        console.print(f"\n[bold]📋 Summary:[/bold]")
-        console.print(f"• Project path: {result['project_path']}")
-        console.print(f"• Directories created: {len(result['directories_created'])}")
-        console.print(f"• Files generated: {len(result['files_created'])}")
+    # Validate compatibility unless the caller already did
+    if not compatibility_checked:
+        from .validators import validate_compatibility
         
-        console.print(f"\n[bold]🎯 Next steps:[/bold]")
-        console.print(f"1. [cyan]cd {project_name}[/cyan]")
-        console.print(f"2. [cyan]cp .env.example .env[/cyan]")
-        console.print(f"3. Edit .env file with your API keys")
-        console.print(f"4. Read CLAUDE.md for detailed setup instructions")
+        validate_compatibility(config.frontend, config.ui_framework)
+    
+    _generate_and_report(project_path, config)
+
+
+def create_project(project_name: str) -> None:
+    """Create a new project with the given name.
+    
+    Args:
+        project_name: Name of the project to create
         
-        if frontend and package_manager:
-            console.print(f"5. [cyan]cd frontend && {package_manager} install[/cyan]")
-        if backend == "python":
-            console.print(f"6. [cyan]cd backend && pip install -r requirements.txt[/cyan]")
-    else:
-        raise Exception("Project generation failed")
+    Raises:
+        ValueError: If project name is invalid
+        FileExistsError: If directory already exists
+    """
+    project_path = _start_project(project_name)
+    config = _build_config_interactively(project_name)
+    _generate_and_report(project_path, config)
 
 
 @click.command(name='create-claude-app')
@@ -279,6 +339,8 @@ def main(
         
         if any_args_provided:
             # Non-interactive mode: use CLI arguments with defaults
+            from .prompts import ProjectConfiguration
+            from .validators import validate_compatibility
             
             # Apply defaults for missing arguments
             final_frontend = validate_cli_option(
@@ -321,19 +383,25 @@ def main(
                 # Convert to click.BadParameter for better CLI error formatting
                 raise click.BadParameter(str(e))
             
-            create_project_with_config(project_name, config)
+            create_project_with_config(project_name, config, compatibility_checked=True)
         else:
             # Interactive mode: use existing interactive prompts
             create_project(project_name)
             
-        console.print(f"[green]✅ Project '{project_name}' created successfully![/green]")
+        _get_console().print(f"[green]✅ Project '{project_name}' created successfully![/green]")
     except click.BadParameter as e:
-        console.print(f"[red]❌ {e}[/red]")
+        _get_console().print(f"[red]❌ {e}[/red]")
         raise click.ClickException(str(e))
     except (ValueError, FileExistsError) as e:
-        console.print(f"[red]❌ Error: {e}[/red]")
+        _get_console().print(f"[red]❌ Error: {e}[/red]")
         raise click.ClickException(str(e))
     except Exception as e:
+        console = _get_console()
+        # Unexpected errors are re-raised as ClickException below, so an
+        # installed excepthook would never see them; render the traceback here.
+        # Local variables are only rendered when debugging; repr-ing every
+        # frame's locals is slow and buries the actual error for end users.
+        console.print_exception(show_locals=bool(os.environ.get('CREATE_CLAUDE_APP_DEBUG')))
         console.print(f"[red]❌ Unexpected error: {e}[/red]")
         console.print(f"[yellow]Please report this issue at: https://github.com/swhsiang/create-claude-app/issues[/yellow]")
         raise click.ClickException(str(e))
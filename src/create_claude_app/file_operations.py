@@ -2,9 +2,10 @@
 import json
 import os
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from pathlib import Path
-from typing import List, Optional, Dict, Any
+from itertools import compress, product, repeat
+from typing import List, NamedTuple, Optional, Dict, Any, Sequence, Tuple, Union
 
 
 class FileOperationError(Exception):
@@ -15,13 +16,30 @@ class FileOperationError(Exception):
         self.path = path
 
 
-@dataclass
+@dataclass(frozen=True)
 class ProjectStructure:
     """Configuration for project directory structure."""
     project_name: str
     has_frontend: bool = False
     has_backend: bool = False
     has_database: bool = False
+    has_github_actions: bool = False
+
+
+# Directories each optional component adds, parents before children
+_COMPONENT_DIRECTORIES = (
+    ('frontend', os.path.join('frontend', 'src'), os.path.join('frontend', 'public')),
+    ('backend', os.path.join('backend', 'app'), os.path.join('backend', 'tests')),
+    ('migrations',),
+    ('.github', os.path.join('.github', 'workflows')),
+)
+
+# Relative directories to create, keyed on (has_frontend, has_backend,
+# has_database, has_github_actions)
+_DIRECTORY_LAYOUTS = {
+    flags: tuple(d for dirs in compress(_COMPONENT_DIRECTORIES, flags) for d in dirs)
+    for flags in product((False, True), repeat=len(_COMPONENT_DIRECTORIES))
+}
 
 
 def create_directory_structure(project_path: str, structure: ProjectStructure) -> List[str]:
@@ -37,46 +55,32 @@ def create_directory_structure(project_path: str, structure: ProjectStructure) -
     Raises:
         FileOperationError: If directory creation fails
     """
-    project_path_obj = Path(project_path)
+    layout = _DIRECTORY_LAYOUTS[(
+        bool(structure.has_frontend),
+        bool(structure.has_backend),
+        bool(structure.has_database),
+        bool(structure.has_github_actions),
+    )]
     
-    # Check if project directory already exists
-    if project_path_obj.exists():
+    root = os.path.normpath(project_path)
+    
+    # Create root project directory; fails if it already exists
+    try:
+        os.makedirs(root)
+    except FileExistsError:
         raise FileOperationError(f"Project directory already exists: {project_path}")
+    except OSError as e:
+        raise FileOperationError(f"Failed to create directory structure: {e}")
     
-    created_dirs = []
+    created_dirs = [root]
     
     try:
-        # Create root project directory
-        project_path_obj.mkdir(parents=True, exist_ok=False)
-        created_dirs.append(str(project_path_obj))
-        
-        # Create frontend directory if needed
-        if structure.has_frontend:
-            frontend_dir = project_path_obj / 'frontend'
-            frontend_dir.mkdir()
-            created_dirs.append(str(frontend_dir))
-            
-            # Create frontend subdirectories
-            (frontend_dir / 'src').mkdir()
-            (frontend_dir / 'public').mkdir()
-            created_dirs.extend([str(frontend_dir / 'src'), str(frontend_dir / 'public')])
-        
-        # Create backend directory if needed
-        if structure.has_backend:
-            backend_dir = project_path_obj / 'backend'
-            backend_dir.mkdir()
-            created_dirs.append(str(backend_dir))
-            
-            # Create backend subdirectories
-            (backend_dir / 'app').mkdir()
-            (backend_dir / 'tests').mkdir()
-            created_dirs.extend([str(backend_dir / 'app'), str(backend_dir / 'tests')])
-        
-        # Create database/migrations directory if needed
-        if structure.has_database:
-            migrations_dir = project_path_obj / 'migrations'
-            migrations_dir.mkdir()
-            created_dirs.append(str(migrations_dir))
+        # Parents come first in the layout, so a single mkdir per directory
+        # is enough
+        for directory in layout:
+            dir_path = os.path.join(root, directory)
+            os.mkdir(dir_path)
+            created_dirs.append(dir_path)
         
         return created_dirs
         
@@ -86,32 +90,161 @@ def create_directory_structure(project_path: str, structure: ProjectStructure) -
         raise FileOperationError(f"Failed to create directory structure: {e}")
 
 
-def write_file_safe(file_path: str, content: str, overwrite: bool = False) -> None:
+# Flags for creating a file with os.open; O_BINARY keeps Windows from
+# translating newlines.
+_WRITE_FLAGS = os.O_WRONLY | os.O_CREAT | getattr(os, 'O_BINARY', 0)
+
+
+def _open_fd_for_write(file_path: str, flags: int, mode: int) -> int:
+    """Open a file descriptor for writing, creating parent directories only when missing.
+    
+    Most writes go into directories that already exist, so the parent is only
+    created after the first open fails instead of on every call.
+    
+    Args:
+        file_path: Path to the file to open
+        flags: Flags passed to os.open()
+        mode: Permission bits for a newly created file (before the umask)
+        
+    Returns:
+        Open file descriptor
+    """
+    try:
+        return os.open(file_path, flags, mode)
+    except FileNotFoundError:
+        os.makedirs(os.path.dirname(file_path), exist_ok=True)
+        return os.open(file_path, flags, mode)
+
+
+def _write_all(fd: int, data: bytes) -> None:
+    """Write all of data to an open file descriptor and close it."""
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view):]
+    finally:
+        os.close(fd)
+
+
+def write_file_safe_bytes(file_path: str, data: bytes, overwrite: bool = False, executable: bool = False) -> None:
+    """Write already-encoded content to a file safely.
+    
+    Args:
+        file_path: Path to the file to write
+        data: Bytes to write to the file
+        overwrite: Whether to overwrite existing files
+        executable: Whether a newly created file should be executable
+        
+    Raises:
+        FileOperationError: If file operation fails
+    """
+    # O_EXCL fails if the file already exists
+    flags = _WRITE_FLAGS | (os.O_TRUNC if overwrite else os.O_EXCL)
+    
+    try:
+        fd = _open_fd_for_write(file_path, flags, 0o777 if executable else 0o666)
+        _write_all(fd, data)
+        
+    except FileExistsError:
+        raise FileOperationError(f"File already exists: {file_path}")
+    except OSError as e:
+        raise FileOperationError(f"Failed to write file {file_path}: {e}")
+
+
+def write_file_safe(file_path: str, content: str, overwrite: bool = False, executable: bool = False) -> None:
     """Write content to a file safely.
     
     Args:
         file_path: Path to the file to write
         content: Content to write to the file
         overwrite: Whether to overwrite existing files
+        executable: Whether a newly created file should be executable
         
     Raises:
         FileOperationError: If file operation fails
     """
-    file_path_obj = Path(file_path)
+    write_file_safe_bytes(file_path, content.encode('utf-8'), overwrite, executable)
+
+
+class FileEntry(NamedTuple):
+    """A file to write with write_files_bulk."""
+    path: str
+    content: str
+    executable: bool = False
+
+
+# write_files_bulk takes FileEntry values or plain (path, content) pairs
+QueuedFile = Union[Tuple[str, str], FileEntry]
+
+
+def _write_entry(entry: QueuedFile, overwrite: bool) -> None:
+    """Write one queued file, executable only if it was queued as such."""
+    executable = isinstance(entry, FileEntry) and entry.executable
+    write_file_safe(entry[0], entry[1], overwrite, executable)
+
+
+# Writes are I/O bound and release the GIL, so the pool size is not tied
+# to the CPU count; a project has a few dozen files at most.
+_BULK_WRITE_WORKERS = 8
+
+
+def _write_run(entries: Sequence[QueuedFile], overwrite: bool) -> Tuple[List[str], Optional[FileOperationError]]:
+    """Write files one after another, stopping at the first failure.
     
-    # Check if file already exists
-    if file_path_obj.exists() and not overwrite:
-        raise FileOperationError(f"File already exists: {file_path}")
+    Returns:
+        The paths written and the error that stopped the run, if any
+    """
+    written: List[str] = []
+    for entry in entries:
+        try:
+            _write_entry(entry, overwrite)
+        except FileOperationError as e:
+            return written, e
+        written.append(entry[0])
+    return written, None
+
+
+def write_files_bulk(entries: Sequence[QueuedFile], overwrite: bool = False) -> List[str]:
+    """Write several files concurrently.
     
-    try:
-        # Create parent directories if they don't exist
-        file_path_obj.parent.mkdir(parents=True, exist_ok=True)
+    Missing parent directories are created by whichever write first finds
+    them missing, so directories that already exist cost nothing extra.
+    Only entries queued as FileEntry(..., executable=True) are created
+    executable.
+    If any write fails, the files that were written are removed again.
+    
+    Args:
+        entries: FileEntry values or (file path, content) pairs to write
+        overwrite: Whether to overwrite existing files
         
-        # Write content to file
-        file_path_obj.write_text(content, encoding='utf-8')
+    Returns:
+        List of written file paths, in the order given
         
-    except OSError as e:
-        raise FileOperationError(f"Failed to write file {file_path}: {e}")
+    Raises:
+        FileOperationError: If any file operation fails
+    """
+    if len(entries) < 2:
+        # Not worth spinning up a pool for a single file
+        for entry in entries:
+            _write_entry(entry, overwrite)
+        return [entry[0] for entry in entries]
+    
+    # One contiguous run of entries per worker instead of one task per
+    # file; callers group entries by directory, so each run stays local
+    run_size = -(-len(entries) // _BULK_WRITE_WORKERS)
+    runs = [entries[i:i + run_size] for i in range(0, len(entries), run_size)]
+    
+    with ThreadPoolExecutor(max_workers=len(runs)) as executor:
+        results = list(executor.map(_write_run, runs, repeat(overwrite)))
+    
+    written = [path for run_written, _ in results for path in run_written]
+    errors = [error for _, error in results if error is not None]
+    
+    if errors:
+        cleanup_on_error(written)
+        raise errors[0]
+    
+    return written
 
 
 def copy_template_file(template_path: str, dest_path: str) -> None:
@@ -124,27 +257,79 @@ def copy_template_file(template_path: str, dest_path: str) -> None:
     Raises:
         FileOperationError: If file operation fails
     """
-    template_path_obj = Path(template_path)
-    dest_path_obj = Path(dest_path)
-    
-    # Check if template file exists
-    if not template_path_obj.exists():
+    try:
+        try:
+            shutil.copy2(template_path, dest_path)
+        except FileNotFoundError:
+            # Either the template or the destination directory is missing;
+            # only create the directory and retry in the latter case
+            dest_dir = os.path.dirname(dest_path)
+            if not dest_dir or not os.path.isfile(template_path):
+                raise
+            os.makedirs(dest_dir, exist_ok=True)
+            shutil.copy2(template_path, dest_path)
+        
+    except FileNotFoundError:
         raise FileOperationError(f"Template file not found: {template_path}")
+    except OSError as e:
+        raise FileOperationError(f"Failed to copy template file: {e}")
+
+
+def copy_template_files(template_dir: str, mapping: Dict[str, str]) -> List[str]:
+    """Copy several template files from one directory.
     
-    try:
-        # Create parent directories if they don't exist
-        dest_path_obj.parent.mkdir(parents=True, exist_ok=True)
+    The template directory is listed once up front, so individual templates
+    don't need their own existence checks.
+    
+    Args:
+        template_dir: Directory containing the template files
+        mapping: Template file names mapped to their destination paths
         
-        # Copy the file
-        shutil.copy2(template_path_obj, dest_path_obj)
+    Returns:
+        List of created file paths
         
+    Raises:
+        FileOperationError: If a template is missing or copying fails
+    """
+    try:
+        with os.scandir(template_dir) as it:
+            entries = {entry.name: entry for entry in it if entry.is_file()}
     except OSError as e:
-        raise FileOperationError(f"Failed to copy template file: {e}")
+        raise FileOperationError(f"Failed to read template directory {template_dir}: {e}")
+    
+    copied_files = []
+    created_parents = set()
+    
+    for template_name, dest_path in mapping.items():
+        entry = entries.get(template_name)
+        if entry is None:
+            template_path = os.path.join(template_dir, template_name)
+            raise FileOperationError(f"Template file not found: {template_path}")
+        
+        try:
+            parent = os.path.dirname(dest_path)
+            if parent and parent not in created_parents:
+                os.makedirs(parent, exist_ok=True)
+                created_parents.add(parent)
+            shutil.copy2(entry.path, dest_path)
+        except OSError as e:
+            raise FileOperationError(f"Failed to copy template file: {e}")
+        
+        copied_files.append(dest_path)
+    
+    return copied_files
+
+
+# json.dumps builds a new encoder whenever it is given options; reuse one
+_encode_mcp_json = json.JSONEncoder(indent=2).encode
 
 
 def write_mcp_config_file(project_path: str, mcp_config: Optional[Dict[str, Any]]) -> Optional[str]:
     """Write MCP configuration file to project directory.
     
+    generate_project() queues the pre-rendered .mcp.json with the rest of the
+    project files; this helper is kept for callers holding a config dict.
+    
     Args:
         project_path: Path to the project root directory
         mcp_config: MCP configuration dictionary or None to skip creation
@@ -158,20 +343,21 @@ def write_mcp_config_file(project_path: str, mcp_config: Optional[Dict[str, Any]
     if mcp_config is None:
         return None
     
-    project_path_obj = Path(project_path)
-    mcp_file_path = project_path_obj / '.mcp.json'
+    mcp_file_path = os.path.join(project_path, '.mcp.json')
     
     try:
-        # Ensure project directory exists
-        if not project_path_obj.exists():
-            raise FileOperationError(f"Project directory does not exist: {project_path}")
-        
-        # Write MCP configuration as JSON
-        mcp_content = json.dumps(mcp_config, indent=2)
-        write_file_safe(str(mcp_file_path), mcp_content)
+        # Write MCP configuration as JSON. The file is opened directly rather
+        # than through write_file_safe so a missing project directory is
+        # reported instead of being created.
+        mcp_content = _encode_mcp_json(mcp_config).encode('utf-8')
+        _write_all(os.open(mcp_file_path, _WRITE_FLAGS | os.O_EXCL, 0o666), mcp_content)
         
-        return str(mcp_file_path)
+        return mcp_file_path
         
+    except FileNotFoundError:
+        raise FileOperationError(f"Project directory does not exist: {project_path}")
+    except FileExistsError:
+        raise FileOperationError(f"File already exists: {mcp_file_path}")
     except (OSError, ValueError, TypeError) as e:
         raise FileOperationError(f"Failed to write MCP configuration: {e}")
 
@@ -182,19 +368,34 @@ def cleanup_on_error(created_paths: List[str]) -> None:
     Args:
         created_paths: List of file/directory paths to clean up
     """
-    # Sort paths by depth (deepest first) to avoid deletion order issues
-    paths_to_clean = sorted(created_paths, key=lambda p: len(Path(p).parts), reverse=True)
+    if not created_paths:
+        return
+    
+    # Usually the project root is among the created paths and every other path
+    # lives inside it, so a single rmtree of the root removes everything in
+    # one walk. The common ancestor is only removed when we created it.
+    try:
+        root = os.path.commonpath(created_paths)
+    except ValueError:
+        # Mixed absolute/relative paths or different drives
+        root = None
+    
+    created_set = {os.path.normpath(p) for p in created_paths}
+    if root in created_set and os.path.isdir(root):
+        shutil.rmtree(root, ignore_errors=True)
+        return
     
-    for path in paths_to_clean:
+    # Callers record parents before their children, so walking the list
+    # backwards visits the deepest paths first. Order only saves work: removing
+    # a parent first just makes its children missing, which is ignored below.
+    for path in reversed(created_paths):
         try:
-            path_obj = Path(path)
-            if path_obj.exists():
-                if path_obj.is_dir():
-                    # Remove directory and all its contents
-                    shutil.rmtree(path_obj)
-                else:
-                    # Remove file
-                    path_obj.unlink()
+            if os.path.isdir(path):
+                # Remove directory and all its contents
+                shutil.rmtree(path)
+            else:
+                # Remove file; already-missing paths raise and are ignored
+                os.remove(path)
         except OSError:
             # Ignore errors during cleanup
             pass
\ No newline at end of file
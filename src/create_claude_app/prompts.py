@@ -1,5 +1,6 @@
 """User interaction prompts for project configuration."""
 from dataclasses import dataclass
+from functools import cached_property
 from typing import Optional
 
 from rich.console import Console
@@ -8,10 +9,30 @@ from rich.table import Table
 
 console = Console()
 
+# Display names that differ from the plain title-cased option value
+_BACKEND_DISPLAY_NAMES = {
+    'python': 'Python (FastAPI)',
+}
 
-@dataclass
+_DATABASE_DISPLAY_NAMES = {
+    'postgresql': 'PostgreSQL',
+    'mysql': 'MySQL',
+    'sqlite': 'SQLite',
+}
+
+_UI_FRAMEWORK_DISPLAY_NAMES = {
+    'tailwind': 'Tailwind CSS',
+    'shadcn': 'shadcn/ui',
+}
+
+
+@dataclass(frozen=True)
 class ProjectConfiguration:
-    """Configuration for a new project."""
+    """Configuration for a new project.
+    
+    Instances are immutable and hashable so generator output can be cached
+    per configuration.
+    """
     project_name: str
     frontend: Optional[str] = None
     ui_framework: Optional[str] = None
@@ -22,6 +43,50 @@ class ProjectConfiguration:
     build_tool: Optional[str] = None
     use_github_actions: bool = False
     use_mcp: bool = False
+    
+    @cached_property
+    def database_name(self) -> str:
+        """Database name derived from the project name (hyphens become underscores)."""
+        return self.project_name.replace('-', '_')
+    
+    @cached_property
+    def frontend_title(self) -> Optional[str]:
+        """Frontend framework name in title case, e.g. 'React'."""
+        return self.frontend.title() if self.frontend else None
+    
+    @cached_property
+    def database_title(self) -> Optional[str]:
+        """Database name in title case, e.g. 'Postgresql'."""
+        return self.database.title() if self.database else None
+    
+    @cached_property
+    def backend_display(self) -> Optional[str]:
+        """Human-readable backend name, e.g. 'Python (FastAPI)'."""
+        if not self.backend:
+            return None
+        return _BACKEND_DISPLAY_NAMES.get(self.backend) or self.backend.title()
+    
+    @cached_property
+    def database_display(self) -> Optional[str]:
+        """Human-readable database name, e.g. 'PostgreSQL'."""
+        if not self.database:
+            return None
+        return _DATABASE_DISPLAY_NAMES.get(self.database) or self.database.title()
+    
+    @cached_property
+    def ui_framework_display(self) -> Optional[str]:
+        """Human-readable UI framework name, e.g. 'Tailwind CSS'."""
+        if not self.ui_framework:
+            return None
+        return _UI_FRAMEWORK_DISPLAY_NAMES.get(self.ui_framework) or self.ui_framework.title()
+
+
+_FRONTEND_CHOICES = {
+    "1": "react",
+    "2": "vue",
+    "3": "angular",
+    "4": None
+}
 
 
 def get_frontend_choice() -> Optional[str]:
@@ -48,14 +113,14 @@ def get_frontend_choice() -> Optional[str]:
         default="4"
     )
     
-    choices_map = {
-        "1": "react",
-        "2": "vue",
-        "3": "angular",
-        "4": None
-    }
-    
-    return choices_map[choice]
+    return _FRONTEND_CHOICES[choice]
+
+
+_UI_FRAMEWORK_CHOICES = {
+    "1": "tailwind",
+    "2": "shadcn",
+    "3": None
+}
 
 
 def get_ui_framework_choice(frontend: Optional[str]) -> Optional[str]:
@@ -91,13 +156,15 @@ def get_ui_framework_choice(frontend: Optional[str]) -> Optional[str]:
         default="3"
     )
     
-    choices_map = {
-        "1": "tailwind",
-        "2": "shadcn",
-        "3": None
-    }
-    
-    return choices_map[choice]
+    return _UI_FRAMEWORK_CHOICES[choice]
+
+
+_BACKEND_CHOICES = {
+    "1": "python",
+    "2": "nodejs",
+    "3": "golang",
+    "4": None
+}
 
 
 def get_backend_choice() -> Optional[str]:
@@ -124,14 +191,15 @@ def get_backend_choice() -> Optional[str]:
         default="4"
     )
     
-    choices_map = {
-        "1": "python",
-        "2": "nodejs",
-        "3": "golang",
-        "4": None
-    }
-    
-    return choices_map[choice]
+    return _BACKEND_CHOICES[choice]
+
+
+_DATABASE_CHOICES = {
+    "1": "mysql",
+    "2": "postgresql",
+    "3": "sqlite",
+    "4": None
+}
 
 
 def get_database_choice() -> Optional[str]:
@@ -158,14 +226,13 @@ def get_database_choice() -> Optional[str]:
         default="4"
     )
     
-    choices_map = {
-        "1": "mysql",
-        "2": "postgresql",
-        "3": "sqlite",
-        "4": None
-    }
-    
-    return choices_map[choice]
+    return _DATABASE_CHOICES[choice]
+
+
+_PACKAGE_MANAGER_CHOICES = {
+    "1": "npm",
+    "2": "yarn"
+}
 
 
 def get_package_manager_choice(frontend: Optional[str]) -> Optional[str]:
@@ -196,12 +263,7 @@ def get_package_manager_choice(frontend: Optional[str]) -> Optional[str]:
         default="1"
     )
     
-    choices_map = {
-        "1": "npm",
-        "2": "yarn"
-    }
-    
-    return choices_map[choice]
+    return _PACKAGE_MANAGER_CHOICES[choice]
 
 
 def get_atlas_choice() -> bool:
@@ -217,6 +279,13 @@ def get_atlas_choice() -> bool:
     )
 
 
+_BUILD_TOOL_CHOICES = {
+    "1": "vite",
+    "2": "webpack",
+    "3": "babel"
+}
+
+
 def get_build_tool_choice(frontend: Optional[str]) -> Optional[str]:
     """Get user's build tool choice.
     
@@ -247,13 +316,7 @@ def get_build_tool_choice(frontend: Optional[str]) -> Optional[str]:
         default="1"
     )
     
-    choices_map = {
-        "1": "vite",
-        "2": "webpack", 
-        "3": "babel"
-    }
-    
-    return choices_map[choice]
+    return _BUILD_TOOL_CHOICES[choice]
 
 
 def get_github_actions_choice() -> bool:
@@ -1,8 +1,13 @@
 """Input validation and compatibility checking functions."""
+import os
 import re
-from pathlib import Path
+import stat
+from functools import lru_cache
 from typing import Optional
 
+# Characters that are not allowed in project names (filesystem-unsafe or spaces)
+_INVALID_PROJECT_NAME_RE = re.compile(r'[/\\:*?"<>| ]')
+
 
 class ValidationError(Exception):
     """Custom exception for validation errors."""
@@ -29,10 +34,9 @@ def validate_project_name(name: str) -> None:
         raise ValidationError("Invalid project name: cannot have leading or trailing spaces")
     
     # Check for invalid characters
-    invalid_chars = ['/', '\\', ':', '*', '?', '"', '<', '>', '|', ' ']
-    for char in invalid_chars:
-        if char in name:
-            raise ValidationError(f"Invalid project name: contains invalid character '{char}'")
+    match = _INVALID_PROJECT_NAME_RE.search(name)
+    if match:
+        raise ValidationError(f"Invalid project name: contains invalid character '{match.group()}'")
 
 
 def validate_directory_not_exists(path: str) -> None:
@@ -44,32 +48,54 @@ def validate_directory_not_exists(path: str) -> None:
     Raises:
         ValidationError: If directory or file already exists
     """
-    path_obj = Path(path)
+    # A single stat answers both "does it exist" and "is it a directory"
+    try:
+        mode = os.stat(path).st_mode
+    except (FileNotFoundError, NotADirectoryError):
+        return
     
-    if path_obj.exists():
-        if path_obj.is_dir():
-            raise ValidationError(f"Directory already exists: {path}")
-        else:
-            raise ValidationError(f"File already exists: {path}")
+    if stat.S_ISDIR(mode):
+        raise ValidationError(f"Directory already exists: {path}")
+    raise ValidationError(f"File already exists: {path}")
 
 
-def validate_compatibility(frontend: Optional[str], ui_framework: Optional[str]) -> None:
-    """Validate frontend and UI framework compatibility.
+@lru_cache(maxsize=None)
+def _compatibility_error(frontend: Optional[str], ui_framework: Optional[str]) -> Optional[str]:
+    """Return the incompatibility message for a frontend/UI pair, if any.
+    
+    The set of possible pairs is tiny, so results are cached.
     
     Args:
         frontend: Selected frontend framework
         ui_framework: Selected UI framework
         
-    Raises:
-        ValidationError: If combination is incompatible
+    Returns:
+        Error message, or None if the combination is compatible
     """
     # UI framework requires a frontend framework
     if ui_framework is not None and frontend is None:
-        raise ValidationError("UI framework requires a frontend framework")
+        return "UI framework requires a frontend framework"
     
     # shadcn/ui is only compatible with React
     if ui_framework == 'shadcn' and frontend not in ['react']:
-        raise ValidationError(f"shadcn/ui is incompatible with {frontend} (React-only)")
+        return f"shadcn/ui is incompatible with {frontend} (React-only)"
+    
+    return None
+
+
+def validate_compatibility(frontend: Optional[str], ui_framework: Optional[str]) -> None:
+    """Validate frontend and UI framework compatibility.
+    
+    Args:
+        frontend: Selected frontend framework
+        ui_framework: Selected UI framework
+        
+    Raises:
+        ValidationError: If combination is incompatible
+    """
+    error = _compatibility_error(frontend, ui_framework)
+    if error is not None:
+        raise ValidationError(error)
 
 
 def validate_mcp_configuration(use_mcp, project_name: Optional[str] = None) -> None:
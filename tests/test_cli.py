@@ -1,4 +1,7 @@
 """Tests for CLI module."""
+import subprocess
+import sys
+
 import pytest
 from click.testing import CliRunner
 from unittest.mock import patch, MagicMock
@@ -46,6 +49,37 @@ class TestCLI:
         assert result.exit_code == 0
         assert "0.1.0" in result.output
 
+    def test_cli_help_does_not_import_heavy_modules(self):
+        """Test that --help doesn't load Rich or the template generators."""
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from create_claude_app.cli import main\n"
+            "CliRunner().invoke(main, ['--help'])\n"
+            "loaded = [m for m in ('rich.traceback', 'create_claude_app.generators')"
+            " if m in sys.modules]\n"
+            "assert not loaded, loaded\n"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True)
+
+        assert result.returncode == 0, result.stderr
+
+    def test_cli_successful_run_does_not_install_traceback_handler(self, tmp_path):
+        """Test that a successful run never loads rich.traceback."""
+        code = (
+            "import sys\n"
+            "from click.testing import CliRunner\n"
+            "from create_claude_app.cli import main\n"
+            "result = CliRunner().invoke(main, ['fast-project', '--frontend', 'react'])\n"
+            "assert result.exit_code == 0, result.output\n"
+            "assert 'rich.traceback' not in sys.modules\n"
+        )
+        result = subprocess.run(
+            [sys.executable, '-c', code], capture_output=True, text=True, cwd=str(tmp_path)
+        )
+
+        assert result.returncode == 0, result.stderr
+
     def test_cli_handles_invalid_project_name(self):
         """Test that CLI handles invalid project names."""
         runner = CliRunner()
@@ -68,6 +102,32 @@ class TestCLI:
             assert result.exit_code != 0
             assert "Directory already exists" in result.output
 
+    def test_cli_prints_traceback_for_unexpected_error(self):
+        """Test that CLI renders the traceback of an unexpected error."""
+        runner = CliRunner()
+
+        with patch('create_claude_app.cli.create_project') as mock_create:
+            mock_create.side_effect = RuntimeError("boom")
+            result = runner.invoke(main, ['broken-project'])
+
+            assert result.exit_code != 0
+            assert "Traceback" in result.output
+            assert "RuntimeError" in result.output
+            assert "Unexpected error: boom" in result.output
+
+    def test_cli_debug_env_var_shows_traceback_locals(self, monkeypatch):
+        """Test that CREATE_CLAUDE_APP_DEBUG turns on traceback locals."""
+        runner = CliRunner()
+        monkeypatch.setenv('CREATE_CLAUDE_APP_DEBUG', '1')
+
+        with patch('create_claude_app.cli.create_project') as mock_create, \
+                patch('create_claude_app.cli._get_console') as mock_console:
+            mock_create.side_effect = RuntimeError("boom")
+            result = runner.invoke(main, ['broken-project'])
+
+            assert result.exit_code != 0
+            mock_console.return_value.print_exception.assert_called_once_with(show_locals=True)
+
 
 class TestCLIArguments:
     """Test CLI argument parsing and validation."""
@@ -341,6 +401,32 @@ class TestCLIArguments:
             assert config.use_github_actions is True
             assert config.use_mcp is False
 
+    def test_cli_skips_repeated_compatibility_check(self):
+        """Test main tells create_project_with_config compatibility was checked."""
+        runner = CliRunner()
+        
+        with patch('create_claude_app.cli.create_project_with_config') as mock_create:
+            mock_create.return_value = None
+            result = runner.invoke(main, ['test-project', '--frontend', 'react', '--ui', 'shadcn'])
+            
+            assert result.exit_code == 0
+            args, kwargs = mock_create.call_args
+            assert kwargs == {'compatibility_checked': True}
+
+    def test_cli_prints_next_steps(self):
+        """Test the summary lists the stack-specific next steps."""
+        runner = CliRunner()
+        
+        with runner.isolated_filesystem():
+            result = runner.invoke(main, [
+                'steps-project', '--frontend', 'react', '--backend', 'python', '--package-manager', 'yarn'
+            ])
+            
+            assert result.exit_code == 0
+            assert '1. cd steps-project' in result.output
+            assert '5. cd frontend && yarn install' in result.output
+            assert '6. cd backend && pip install -r requirements.txt' in result.output
+
     def test_cli_help_shows_all_options(self):
         """Test CLI help shows all available options."""
         runner = CliRunner()
@@ -7,9 +7,13 @@ from unittest.mock import patch, MagicMock
 from create_claude_app.file_operations import (
     create_directory_structure,
     write_file_safe,
+    write_file_safe_bytes,
+    write_files_bulk,
     copy_template_file,
+    copy_template_files,
     cleanup_on_error,
     write_mcp_config_file,
+    FileEntry,
     FileOperationError,
     ProjectStructure,
 )
@@ -67,6 +71,25 @@ class TestFileOperations:
             assert str(project_path) in created_dirs
             assert len(created_dirs) == 1
 
+    def test_create_directory_structure_github_actions(self):
+        """Test that the workflows directory is created with the structure."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir) / 'ci-project'
+            
+            structure = ProjectStructure(
+                project_name='ci-project',
+                has_github_actions=True
+            )
+            
+            created_dirs = create_directory_structure(str(project_path), structure)
+            
+            assert (project_path / '.github' / 'workflows').is_dir()
+            assert created_dirs == [
+                str(project_path),
+                str(project_path / '.github'),
+                str(project_path / '.github' / 'workflows'),
+            ]
+
     def test_create_directory_structure_already_exists(self):
         """Test error when directory already exists."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -142,6 +165,79 @@ class TestFileOperations:
             
             assert file_path.read_text() == new_content
 
+    def test_write_file_safe_bytes_writes_raw_bytes(self):
+        """Test that pre-encoded content is written verbatim."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / 'nested' / 'raw.md'
+            data = '# Título\r\nline two\n'.encode('utf-8')
+            
+            write_file_safe_bytes(str(file_path), data)
+            
+            assert file_path.read_bytes() == data
+            
+            with pytest.raises(FileOperationError) as exc_info:
+                write_file_safe_bytes(str(file_path), b'again')
+            assert 'already exists' in str(exc_info.value)
+
+    def test_write_files_bulk_success(self):
+        """Test writing several files at once."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            entries = [
+                (str(Path(temp_dir) / 'a.txt'), 'A'),
+                (str(Path(temp_dir) / 'sub' / 'b.txt'), 'B'),
+                (str(Path(temp_dir) / 'sub' / 'deep' / 'c.txt'), 'C'),
+            ]
+            
+            written = write_files_bulk(entries)
+            
+            assert written == [path for path, _ in entries]
+            for path, content in entries:
+                assert Path(path).read_text() == content
+
+    def test_write_files_bulk_cleans_up_on_failure(self):
+        """Test that a failed bulk write removes the files it wrote."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            existing = Path(temp_dir) / 'existing.txt'
+            existing.write_text('Original content')
+            new_file = Path(temp_dir) / 'new.txt'
+            
+            with pytest.raises(FileOperationError) as exc_info:
+                write_files_bulk([(str(new_file), 'New'), (str(existing), 'Clobber')])
+            
+            assert 'already exists' in str(exc_info.value)
+            assert not new_file.exists()
+            assert existing.read_text() == 'Original content'
+
+    @pytest.mark.skipif(os.name == 'nt', reason="POSIX permission bits")
+    def test_write_files_bulk_makes_marked_entries_executable(self):
+        """Test that only entries queued as executable get the executable bit."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            script = Path(temp_dir) / 'dev.sh'
+            other = Path(temp_dir) / 'other.sh'
+            notes = Path(temp_dir) / 'notes.txt'
+            
+            write_files_bulk([
+                FileEntry(str(script), '#!/bin/bash\necho hi\n', executable=True),
+                (str(other), '#!/bin/bash\necho hi\n'),
+                (str(notes), 'plain'),
+            ])
+            
+            assert os.access(script, os.X_OK)
+            assert not os.access(other, os.X_OK)
+            assert not os.access(notes, os.X_OK)
+
+    def test_write_files_bulk_single_file_skips_pool(self):
+        """Test that a single pending file is written without a thread pool."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            file_path = Path(temp_dir) / 'nested' / 'only.txt'
+            
+            with patch('create_claude_app.file_operations.ThreadPoolExecutor') as mock_pool:
+                written = write_files_bulk([(str(file_path), 'Only')])
+            
+            mock_pool.assert_not_called()
+            assert written == [str(file_path)]
+            assert file_path.read_text() == 'Only'
+
     def test_copy_template_file_success(self):
         """Test successful template file copying."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -169,6 +265,53 @@ class TestFileOperations:
             
             assert 'Template file not found' in str(exc_info.value)
 
+    def test_copy_template_file_creates_missing_parents(self):
+        """Test that missing destination directories are created on demand."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_path = Path(temp_dir) / 'template.txt'
+            template_path.write_text('Template content')
+            dest_path = Path(temp_dir) / 'nested' / 'deeper' / 'dest.txt'
+
+            copy_template_file(str(template_path), str(dest_path))
+
+            assert dest_path.read_text() == 'Template content'
+
+            # A missing template is still reported, not masked by the retry
+            with pytest.raises(FileOperationError) as exc_info:
+                copy_template_file(str(Path(temp_dir) / 'missing.txt'), str(Path(temp_dir) / 'other' / 'dest.txt'))
+            assert 'Template file not found' in str(exc_info.value)
+            assert not (Path(temp_dir) / 'other').exists()
+
+    def test_copy_template_files_success(self):
+        """Test copying several templates from one directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            template_dir = Path(temp_dir) / 'templates'
+            template_dir.mkdir()
+            (template_dir / 'a.txt').write_text('A')
+            (template_dir / 'b.txt').write_text('B')
+            
+            dest_a = Path(temp_dir) / 'out' / 'a.txt'
+            dest_b = Path(temp_dir) / 'out' / 'nested' / 'b.txt'
+            copied = copy_template_files(str(template_dir), {
+                'a.txt': str(dest_a),
+                'b.txt': str(dest_b),
+            })
+            
+            assert copied == [str(dest_a), str(dest_b)]
+            assert dest_a.read_text() == 'A'
+            assert dest_b.read_text() == 'B'
+
+    def test_copy_template_files_missing_template(self):
+        """Test error when one of the templates doesn't exist."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            dest_path = Path(temp_dir) / 'dest.txt'
+            
+            with pytest.raises(FileOperationError) as exc_info:
+                copy_template_files(temp_dir, {'missing.txt': str(dest_path)})
+            
+            assert 'Template file not found' in str(exc_info.value)
+            assert not dest_path.exists()
+
     def test_cleanup_on_error_success(self):
         """Test successful cleanup of created files and directories."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -217,6 +360,39 @@ class TestFileOperations:
             # Existing directory should be cleaned up
             assert not existing_dir.exists()
 
+    def test_cleanup_on_error_removes_project_root(self):
+        """Test cleanup removes the whole tree when the root was created."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir) / 'project'
+            structure = ProjectStructure(
+                project_name='project',
+                has_frontend=True,
+                has_backend=True
+            )
+            created_dirs = create_directory_structure(str(project_path), structure)
+            (project_path / 'frontend' / 'src' / 'main.tsx').write_text('content')
+            
+            cleanup_on_error(created_dirs)
+            
+            assert not project_path.exists()
+            assert Path(temp_dir).exists()
+
+    def test_cleanup_on_error_keeps_uncreated_parent(self):
+        """Test cleanup never removes a common parent it did not create."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            unrelated = Path(temp_dir) / 'unrelated.txt'
+            unrelated.write_text('keep me')
+            dir1 = Path(temp_dir) / 'dir1'
+            dir1.mkdir()
+            dir2 = Path(temp_dir) / 'dir2'
+            dir2.mkdir()
+            
+            cleanup_on_error([str(dir1), str(dir2)])
+            
+            assert not dir1.exists()
+            assert not dir2.exists()
+            assert unrelated.exists()
+
     def test_project_structure_dataclass(self):
         """Test ProjectStructure dataclass."""
         structure = ProjectStructure(
@@ -280,6 +456,17 @@ class TestFileOperations:
             content = json.loads(mcp_file.read_text())
             assert content == mcp_config
 
+    def test_write_mcp_config_file_matches_json_dumps(self):
+        """Test MCP config file output is byte-identical to json.dumps."""
+        import json
+
+        with tempfile.TemporaryDirectory() as temp_dir:
+            mcp_config = {"mcpServers": {"café": {"command": "npx", "env": {}}}}
+
+            file_path = write_mcp_config_file(temp_dir, mcp_config)
+
+            assert Path(file_path).read_text() == json.dumps(mcp_config, indent=2)
+
     def test_write_mcp_config_file_with_none_config(self):
         """Test MCP config file writing with None config (should not create file)."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -303,6 +490,20 @@ class TestFileOperations:
         
         assert 'Project directory does not exist' in str(exc_info.value)
 
+    def test_write_mcp_config_file_existing_file(self):
+        """Test MCP config file writing does not overwrite an existing file."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            project_path = Path(temp_dir) / 'existing-mcp-project'
+            project_path.mkdir()
+            mcp_file = project_path / '.mcp.json'
+            mcp_file.write_text('{}')
+
+            with pytest.raises(FileOperationError) as exc_info:
+                write_mcp_config_file(str(project_path), {"mcpServers": {}})
+
+            assert 'already exists' in str(exc_info.value)
+            assert mcp_file.read_text() == '{}'
+
     def test_write_mcp_config_file_invalid_json(self):
         """Test MCP config file writing with invalid JSON data."""
         with tempfile.TemporaryDirectory() as temp_dir:
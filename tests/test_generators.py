@@ -3,6 +3,7 @@ import pytest
 import tempfile
 from pathlib import Path
 from unittest.mock import patch, MagicMock
+from create_claude_app.validators import ValidationError
 from create_claude_app.generators import (
     generate_project,
     generate_claude_md,
@@ -15,8 +16,10 @@ from create_claude_app.generators import (
     generate_frontend_entry_points,
     generate_backend_entry_points,
     generate_react_app_tsx,
+    generate_vite_config_vue,
     generate_python_main_py,
     generate_readme,
+    clear_caches,
     TemplateGenerator,
     TemplateError,
     # Docker infrastructure functions
@@ -26,11 +29,13 @@ from create_claude_app.generators import (
     generate_database_dockerfile,
     generate_docker_compose_environments,
     generate_docker_compose_dev,
+    generate_docker_compose_staging,
     generate_docker_compose_prod,
     generate_readme_with_docker,
     generate_docker_optimization_docs,
     # MCP integration functions
     generate_mcp_config,
+    generate_mcp_config_dict,
     generate_mcp_documentation,
 )
 from create_claude_app.prompts import ProjectConfiguration
@@ -106,6 +111,23 @@ class TestTemplateGenerator:
                 generate_project(str(project_path), config)
             
             assert 'already exists' in str(exc_info.value)
+            assert isinstance(exc_info.value.__cause__, ValidationError)
+
+    def test_generate_project_known_missing_still_refuses_existing_directory(self):
+        """Test that skipping the pre-check does not overwrite an existing directory."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = ProjectConfiguration(project_name='existing-project')
+            
+            project_path = Path(temp_dir) / 'existing-project'
+            project_path.mkdir()
+            
+            with patch('create_claude_app.generators.validate_directory_not_exists') as mock_validate:
+                with pytest.raises(TemplateError) as exc_info:
+                    generate_project(str(project_path), config, known_missing=True)
+            
+            mock_validate.assert_not_called()
+            assert 'already exists' in str(exc_info.value)
+            assert list(project_path.iterdir()) == []
 
     def test_generate_claude_md_minimal(self):
         """Test generating CLAUDE.md for minimal project."""
@@ -322,6 +344,22 @@ class TestTemplateGenerator:
         assert 'npm install' in content
         assert 'npm test' in content
         assert 'npm run build' in content
+        assert 'cache-dependency-path: frontend/package-lock.json' in content
+
+    def test_generate_ci_workflow_caches_on_package_manager_lockfile(self):
+        """Test that the frontend cache key follows the package manager's lockfile."""
+        config = ProjectConfiguration(
+            project_name='test-app',
+            frontend='react',
+            package_manager='yarn',
+            use_github_actions=True
+        )
+        
+        content = generate_ci_workflow(config)
+        
+        assert "cache: 'yarn'" in content
+        assert 'cache-dependency-path: frontend/yarn.lock' in content
+        assert 'package-lock.json' not in content
 
     def test_generate_ci_workflow_with_backend(self):
         """Test generating CI workflow with backend."""
@@ -339,6 +377,8 @@ class TestTemplateGenerator:
         assert 'pip install' in content
         assert 'pytest tests/' in content
         assert 'python-version: \'3.11\'' in content
+        assert "cache: 'pip'" in content
+        assert 'cache-dependency-path: backend/requirements.txt' in content
 
     def test_generate_ci_workflow_with_database(self):
         """Test generating CI workflow with database."""
@@ -383,6 +423,37 @@ class TestTemplateGenerator:
             assert (project_path / '.github' / 'workflows' / 'ci.yml').exists()
             assert (project_path / '.github' / 'CLAUDE.md').exists()
 
+    def test_batched_generator_signature_has_optional_pending(self):
+        """Test batched file generators advertise ``pending`` as optional."""
+        import inspect
+
+        signature = inspect.signature(generate_github_actions_files)
+
+        assert list(signature.parameters) == ['project_path', 'config', 'pending']
+        assert signature.parameters['pending'].default is None
+        assert generate_github_actions_files.__name__ == 'generate_github_actions_files'
+        assert 'GitHub Actions' in generate_github_actions_files.__doc__
+
+    def test_generate_github_actions_files_queues_pending_writes(self):
+        """Test that files are queued instead of written when a pending list is given."""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            config = ProjectConfiguration(
+                project_name='test-app',
+                backend='python',
+                use_github_actions=True
+            )
+            
+            project_path = Path(temp_dir) / 'test-app'
+            project_path.mkdir()
+            pending = []
+            
+            files_created = generate_github_actions_files(project_path, config, pending)
+            
+            assert files_created == [path for path, _ in pending]
+            assert len(pending) == 2
+            assert 'name: CI' in pending[0][1]
+            assert not (project_path / '.github').exists()
+
     def test_generate_project_with_github_actions(self):
         """Test generating project with GitHub Actions enabled."""
         with tempfile.TemporaryDirectory() as temp_dir:
@@ -494,6 +565,20 @@ class TestTemplateGenerator:
         assert 'Tailwind CSS' in content
         assert 'import \'./App.css\'' not in content  # Should not import CSS with Tailwind
 
+    def test_generate_vite_config_vue_is_balanced(self):
+        """Test that the Vue Vite config closes defineConfig exactly once."""
+        config = ProjectConfiguration(
+            project_name='vue-app',
+            frontend='vue',
+            build_tool='vite'
+        )
+        
+        content = generate_vite_config_vue(config)
+        
+        assert content.endswith('})')
+        assert content.count('(') == content.count(')')
+        assert content.count('{') == content.count('}')
+
     def test_generate_python_main_py_content(self):
         """Test generating Python main.py content."""
         config = ProjectConfiguration(
@@ -645,6 +730,18 @@ class TestTemplateGenerator:
         assert 'pip install' not in content
         assert 'backend/' not in content
 
+    def test_generators_are_memoized_per_configuration(self):
+        """Test that equal configurations reuse cached output until cleared."""
+        config = ProjectConfiguration(project_name='cached-app', frontend='react')
+        same_config = ProjectConfiguration(project_name='cached-app', frontend='react')
+        
+        first = generate_claude_md(config)
+        assert generate_claude_md(same_config) is first
+        
+        clear_caches()
+        assert generate_claude_md.cache_info().currsize == 0
+        assert generate_claude_md(config) == first
+
 
 class TestDockerInfrastructureGeneration:
     """Test Docker infrastructure generation functionality."""
@@ -854,6 +951,28 @@ class TestDockerInfrastructureGeneration:
         assert 'restart: unless-stopped' in content
         assert 'NODE_ENV=production' in content or 'ENVIRONMENT=production' in content
 
+    def test_generate_docker_compose_staging_environment(self):
+        """Test generating staging docker-compose file."""
+        config = ProjectConfiguration(
+            project_name='staging-app',
+            frontend='react',
+            backend='nodejs',
+            database='mysql'
+        )
+        
+        content = generate_docker_compose_staging(config)
+        
+        assert content.startswith('services:\n  frontend:')
+        assert '"3000:80"' in content
+        assert 'NODE_ENV=staging' in content
+        assert 'ENVIRONMENT=staging' in content
+        assert 'database:5432/staging_app' in content
+        assert '"3306:3306"' in content
+        assert content.count('restart: unless-stopped') == 3
+        assert 'deploy:' not in content
+        assert 'DEBUG=true' not in content
+        assert content.endswith('volumes:\n  db_data:')
+
     def test_generate_readme_with_docker_commands(self):
         """Test generating README with Docker commands section."""
         config = ProjectConfiguration(
@@ -969,6 +1088,21 @@ class TestMCPIntegration:
         content = generate_mcp_config(config)
         assert content is None
 
+    def test_generate_mcp_config_dict_matches_json(self):
+        """Test that the dictionary form serializes to the generated .mcp.json."""
+        import json
+        
+        enabled = ProjectConfiguration(project_name='mcp-app', use_mcp=True)
+        disabled = ProjectConfiguration(project_name='no-mcp-app', use_mcp=False)
+        
+        mcp_dict = generate_mcp_config_dict(enabled)
+        assert json.dumps(mcp_dict, indent=2) == generate_mcp_config(enabled)
+        
+        # Each call returns a fresh dictionary the caller may modify
+        mcp_dict['mcpServers'].clear()
+        assert generate_mcp_config_dict(enabled)['mcpServers']
+        assert generate_mcp_config_dict(disabled) is None
+
     def test_generate_mcp_documentation_content(self):
         """Test generating MCP documentation content."""
         config = ProjectConfiguration(
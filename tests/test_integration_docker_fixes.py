@@ -301,6 +301,20 @@ class TestDockerDevelopmentImprovements:
         assert 'docker-compose -f docker-compose.dev.yml up --build' in content
         assert 'Frontend: http://localhost:3001' in content
 
+    def test_generate_dev_script_skips_port_check_for_sqlite(self):
+        """Test dev.sh doesn't free or report a database port for SQLite."""
+        config = ProjectConfiguration(
+            project_name='sqlite-dev-app',
+            backend='python',
+            database='sqlite'
+        )
+
+        content = generate_dev_script(config)
+
+        assert 'kill_port 8000 "Backend"' in content
+        assert '"SQLite"' not in content
+        assert 'Database: localhost' not in content
+
     def test_complete_dev_environment_integration(self):
         """Test complete development environment with all improvements."""
         runner = CliRunner()
@@ -179,6 +179,30 @@ class TestPrompts:
         assert config.use_github_actions is False
         assert config.use_mcp is False
 
+    def test_project_configuration_database_name(self):
+        """Test that the derived database name is computed once and keeps equality."""
+        config = ProjectConfiguration(project_name='my-cool-app', database='postgresql')
+        
+        assert config.database_name == 'my_cool_app'
+        assert config.database_name is config.database_name
+        assert config == ProjectConfiguration(project_name='my-cool-app', database='postgresql')
+
+    def test_project_configuration_display_names(self):
+        """Test human-readable names for the selected technologies."""
+        config = ProjectConfiguration(
+            project_name='my-app',
+            frontend='react',
+            ui_framework='shadcn',
+            backend='python',
+            database='mysql'
+        )
+
+        assert config.ui_framework_display == 'shadcn/ui'
+        assert config.backend_display == 'Python (FastAPI)'
+        assert config.database_display == 'MySQL'
+        assert ProjectConfiguration(project_name='my-app').ui_framework_display is None
+        assert ProjectConfiguration(project_name='my-app', database='sqlite').database_display == 'SQLite'
+
     def test_get_build_tool_choice_valid_options(self):
         """Test build tool selection with valid options."""
         with patch('rich.prompt.Prompt.ask') as mock_ask:
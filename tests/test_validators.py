@@ -56,6 +56,12 @@ class TestValidators:
                 validate_project_name(name)
             assert 'Invalid project name' in str(exc_info.value)
 
+    def test_validate_project_name_reports_offending_character(self):
+        """Test that the first invalid character is named in the error."""
+        with pytest.raises(ValidationError) as exc_info:
+            validate_project_name('my|pro:ject')
+        assert "invalid character '|'" in str(exc_info.value)
+
     def test_validate_directory_not_exists_success(self):
         """Test validation when directory does not exist."""
         with tempfile.TemporaryDirectory() as temp_dir: